@@ -13,6 +13,14 @@ __all__ = ["get_index", "external_router"]
 external_router = APIRouter()
 """FastAPI router for all external handlers."""
 
+_index = Index(
+    metadata=get_metadata(
+        package_name="jupyterlab-controller",
+        application_name=config.name,
+    )
+)
+"""Response for the external root, which does not change after startup."""
+
 
 @external_router.get(
     "/",
@@ -43,8 +51,4 @@ async def get_index(
     # logger for more complex logging.
     logger.info("Request for application metadata")
 
-    metadata = get_metadata(
-        package_name="jupyterlab-controller",
-        application_name=config.name,
-    )
-    return Index(metadata=metadata)
+    return _index
@@ -18,6 +18,12 @@ __all__ = ["get_index", "internal_router"]
 internal_router = APIRouter()
 """FastAPI router for all internal handlers."""
 
+_metadata = get_metadata(
+    package_name="jupyterlab-controller",
+    application_name=config.name,
+)
+"""Application metadata, which does not change over the process lifetime."""
+
 
 @internal_router.get(
     "/",
@@ -35,8 +41,7 @@ async def get_index() -> Metadata:
     """GET ``/`` (the app's internal root).
 
     By convention, this endpoint returns only the application's metadata.
+    The metadata is computed once at import since it cannot change while the
+    process is running, which keeps this endpoint cheap as a health check.
     """
-    return get_metadata(
-        package_name="jupyterlab-controller",
-        application_name=config.name,
-    )
+    return _metadata